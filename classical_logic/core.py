@@ -19,8 +19,20 @@ Proposition
 from abc import abstractmethod, ABC
 from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
-import re
-from typing import ClassVar, overload, NoReturn
+from functools import reduce
+from operator import and_, or_
+import sys
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    overload,
+    NoReturn,
+    Optional,
+    Sequence,
+    Union,
+)
+from weakref import WeakValueDictionary
 
 
 class Proposition(ABC):
@@ -179,24 +191,19 @@ class Proposition(ABC):
         assert u({'p': False, 'q': False}) is False
         ```
 
-    Note: Note: Short Circuiting
-        Interpreting a proposition uses "short circuiting" for efficiency.
-        This means that the second operand will not be interpreted if the
-        truth value of the first operand already determines the value of the
+    Note: Note: No Short Circuiting
+        Interpreting a proposition does not "short circuit". Every atomic in
+        the proposition must be assigned a truth value, even if the truth
+        value of the first operand already determines the value of the
         connective.
 
-        Short circuiting matters when not every atomic in the proposition is
-        assigned a truth value. Normally, this would raise a `ValueError`, but
-        if we never need to interpret the missing atomic, it may return a
-        boolean instead.
-
         Example:
 
         ```python
         import classical-logic as pl
 
         u = pl.prop("p | q")
-        assert u(p=True) is True  # No error because `q` was never interpreted
+        u(p=True)  # Raises ValueError because `q` is not assigned
         ```
 
     # Comparing Propositions
@@ -229,6 +236,24 @@ class Proposition(ABC):
 
     """  # noqa: E501
 
+    __slots__ = ("_compiled", "_function", "_hash", "_str", "__weakref__")
+
+    _compiled: "_Program"
+    """Compiled program of this proposition. Only set once `_program()` has
+    been called."""
+
+    _str: str
+    """Cached simple string representation of this proposition. Only set once
+    `__str__` has been called."""
+
+    _function: Callable[[Mapping[str, bool]], bool]
+    """Function generated from the compiled program of this proposition. Only
+    set once `compile()` has been called."""
+
+    _hash: int
+    """Cached hash of a compound proposition. Only set once `__hash__` has
+    been called."""
+
     #
     # Accessing Methods
     #
@@ -326,7 +351,7 @@ class Proposition(ABC):
 
         [1]: https://docs.python.org/3/library/constants.html#NotImplemented
         """
-        if isinstance(other, Proposition):
+        if type(other) in _types or isinstance(other, Proposition):
             return And(self, other)
         return NotImplemented
 
@@ -336,7 +361,7 @@ class Proposition(ABC):
 
         [1]: https://docs.python.org/3/library/constants.html#NotImplemented
         """
-        if isinstance(other, Proposition):
+        if type(other) in _types or isinstance(other, Proposition):
             return Or(self, other)
         return NotImplemented
 
@@ -398,22 +423,155 @@ class Proposition(ABC):
             ValueError: One of the predicates was not assigned a truth value in
                 the interpretation.
         """
-        if mapping is None:
-            return self._interpret(kwargs)
-        return self._interpret(mapping)
+        return self._interpret(kwargs if mapping is None else mapping)
 
-    @abstractmethod
     def _interpret(self, interpretation: Mapping[str, bool], /) -> bool:
         """Returns the truth value of this proposition under the given
         interpretation. Raises `ValueError` when one of the predicates in the
         proposition is not specified, even if the predicate need not to be
         evaluated (do not short circuit).
 
-        This is an abstract internal method which is delegated to by
-        `__call__`. Subclasses must implement this method in order to fully
-        implement `__call__`.
+        This is an internal method which is delegated to by `__call__`. The
+        truth values of the predicates are looked up once, up front, and then
+        the compiled program of this proposition is run over them; no
+        recursion is involved, so arbitrarily deep propositions may be
+        interpreted.
+        """
+        function = getattr(self, "_function", None)
+        if function is not None:
+            return function(interpretation)
+        program = self._program()
+        return _run(program.code, _lookup(program.names, interpretation))
+
+    def _program(self) -> "_Program":
+        """Returns the compiled program of this proposition. The program is
+        compiled on the first call and cached on the instance afterwards."""
+        try:
+            return self._compiled
+        except AttributeError:
+            program = _compile(self)
+            # Propositions are frozen, so bypass the generated __setattr__
+            object.__setattr__(self, "_compiled", program)
+            return program
+
+    def compile(self, /) -> Callable[[Mapping[str, bool]], bool]:
+        """Returns a function which interprets this proposition, given a
+        mapping from predicate names to truth values.
+
+        The function is generated as Python code specialized to this
+        proposition, so it is faster than the general interpreter when the
+        same proposition is interpreted many times. Once this method has been
+        called, calling the proposition itself uses the function as well.
+
+        Like calling the proposition, the function raises
+        [`ValueError`][ValueError] if one of the predicates was not assigned a
+        truth value.
+
+        Example:
+            ```python
+            import classical_logic as cl
+
+            f = cl.prop('P -> Q').compile()
+            assert f({'P': True, 'Q': False}) is False
+            assert f({'P': False, 'Q': False}) is True
+            ```
+        """
+        try:
+            return self._function
+        except AttributeError:
+            function = _generate(self._program())
+            object.__setattr__(self, "_function", function)
+            return function
+
+    def truth_table(
+        self, names: Optional[Sequence[str]] = None, /
+    ) -> list[bool]:
+        """Returns the truth values of this proposition under every possible
+        interpretation of the given predicate names, in the order of the rows
+        of a conventional truth table: the first name varies the slowest, and
+        *true* comes before *false*.
+
+        If `names` is not given, the names of the predicates in this
+        proposition are used, in the order they first appear.
+
+        Raises [`ValueError`][ValueError] if one of the predicates in this
+        proposition is not in `names`, or if a name is given more than once.
+
+        Example:
+            ```python
+            import classical_logic as cl
+
+            # Rows: (T, T), (T, F), (F, T), (F, F)
+            assert cl.prop('P -> Q').truth_table() == [True, False, True, True]
 
+            # Rows: (Q=T, P=T), (Q=T, P=F), (Q=F, P=T), (Q=F, P=F)
+            assert cl.prop('P -> Q').truth_table(['Q', 'P']) == [
+                True, True, False, True
+            ]
+            ```
         """
+        program = self._program()
+        if names is None:
+            names = program.names
+        positions: dict[str, int] = {}
+        for i, name in enumerate(names):
+            if name in positions:
+                raise ValueError(f"Predicate {name!r} is given more than once")
+            positions[name] = i
+        try:
+            columns = [positions[name] for name in program.names]
+        except KeyError as e:
+            raise ValueError(
+                f"Predicate {e.args[0]!r} is not one of the given names"
+            ) from None
+
+        # Every row is evaluated at once by packing the truth values of each
+        # predicate into the bits of an integer, one bit per row. The first
+        # row is the most significant bit.
+        rows = 1 << len(names)
+        packed = _packed_columns(len(names))
+        result = _run_packed(
+            program.code, [packed[i] for i in columns], (1 << rows) - 1
+        )
+        return _unpack(result, rows)
+
+    def interpret_many(
+        self, interpretations: Sequence[Mapping[str, bool]], /
+    ) -> list[bool]:
+        """Returns the truth values of this proposition under each of the
+        given interpretations, in order.
+
+        This gives the same results as interpreting the proposition once for
+        each interpretation, but the compiled program of the proposition is
+        run only once for all of them.
+
+        Raises [`ValueError`][ValueError] if one of the predicates was not
+        assigned a truth value in one of the interpretations.
+
+        Example:
+            ```python
+            import classical_logic as cl
+
+            u = cl.prop('P -> Q')
+            assert u.interpret_many([
+                {'P': True, 'Q': False},
+                {'P': False, 'Q': False},
+            ]) == [False, True]
+            ```
+        """
+        if not interpretations:
+            return []
+        program = self._program()
+        rows = [_lookup(program.names, i) for i in interpretations]
+        # The truth values of each predicate are packed into the bits of an
+        # integer, one bit per interpretation, with the first as the most
+        # significant bit
+        packed = [
+            int(bytes(column).translate(_binary_digits), 2)
+            for column in zip(*rows)
+        ]
+        n = len(interpretations)
+        return _unpack(_run_packed(program.code, packed, (1 << n) - 1), n)
 
     #
     # String Formatting Methods
@@ -453,7 +611,17 @@ class Proposition(ABC):
             return str(self)
         raise ValueError(f"Invalid format specification: {format_spec!r}")
 
-    @abstractmethod
+    def __str__(self) -> str:
+        """Returns the "simple" representation of this proposition. See
+        `__format__` for more information. The string is cached on the
+        instance after the first call."""
+        try:
+            return self._str
+        except AttributeError:
+            string = self._build_str(False)
+            object.__setattr__(self, "_str", string)
+            return string
+
     def _explicit_str(self) -> str:
         """Returns the "explicit" representation of this proposition, in which
         every binary operation is surrounded with parentheses, always.
@@ -463,10 +631,37 @@ class Proposition(ABC):
             import classical-logic as pl
 
             s = pl.prop('P & Q & R')
-            assert s.formal() == '((P & Q) & R)'
+            assert format(s, 'X') == '((P & Q) & R)'
             assert str(s) == 'P & Q & R'
             ```
         """
+        return self._build_str(True)
+
+    def _build_str(self, explicit: bool, /) -> str:
+        """Returns the explicit representation of this proposition if
+        `explicit` is true; otherwise the simple representation.
+
+        The string is built with an explicit stack rather than recursion, and
+        is joined together once at the end.
+        """
+        parts: list[str] = []
+        todo: list[Union[Proposition, str]] = [self]
+        while todo:
+            item = todo.pop()
+            if isinstance(item, str):
+                parts.append(item)
+            else:
+                todo += reversed(item._str_parts(explicit))
+        return "".join(parts)
+
+    @abstractmethod
+    def _str_parts(
+        self, explicit: bool, /
+    ) -> tuple[Union["Proposition", str], ...]:
+        """Returns the parts which make up the string representation of this
+        proposition, in order. Components of this proposition are left as
+        propositions, to be expanded by `_build_str`.
+        """
 
     #
     # Miscellaneous special methods
@@ -486,17 +681,477 @@ class Proposition(ABC):
         )
 
 
-_ident_pattern: re.Pattern = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+#
+# Compiled Programs
+#
+
+# Opcodes of a compiled program. Each instruction is a pair of integers: the
+# opcode and its argument, which is only used by _LOAD, _STORE, _FETCH, _ALL,
+# and _ANY.
+_LOAD = 0
+_NOT = 1
+_AND = 2
+_OR = 3
+_IMPLIES = 4
+_IFF = 5
+_STORE = 6
+_FETCH = 7
+_ALL = 8
+_ANY = 9
 
+# Opcodes of the n-ary forms of the associative binary opcodes, which are
+# used for chains of the same operation, such as P & Q & R.
+_n_ary: dict[int, int] = {_AND: _ALL, _OR: _ANY}
 
-@dataclass(frozen=True, repr=False)
+
+@dataclass(frozen=True)
+class _Program:
+    """A proposition compiled into a flat sequence of postfix instructions,
+    which can be interpreted with a single loop over a stack of truth values
+    instead of a recursive walk over the tree.
+
+    For example, `(P & Q) | ~P` compiles into the following program:
+
+    ```
+    names = ("P", "Q")
+    code  = (_LOAD, 0, _LOAD, 1, _AND, 0, _LOAD, 0, _NOT, 0, _OR, 0)
+    ```
+
+    A sub-proposition which appears more than once as the same object is only
+    compiled once; its truth value is saved with `_STORE` and reused with
+    `_FETCH` in its other places. The argument of both is the index of the
+    saved value, in the order the values are saved.
+
+    A chain of conjunctions or disjunctions with more than two operands, such
+    as `P & Q & R`, is compiled into its operands followed by a single `_ALL`
+    or `_ANY` instruction, whose argument is the number of operands.
+
+    Attributes:
+        names (tuple[str, ...]): Names of the predicates in the order they
+            first appear. The argument of a `_LOAD` instruction is an index
+            into this tuple.
+        code (tuple[int, ...]): The instructions, flattened into pairs of
+            opcodes and arguments. A tuple is used rather than `bytes` or an
+            `array`, since iterating over those creates a new int object for
+            every item, which makes running the program slower.
+    """
+
+    names: tuple[str, ...]
+    code: tuple[int, ...]
+
+
+def _compile(prop: Proposition, /) -> _Program:
+    """Compiles the given proposition into a `_Program`."""
+    names: list[str] = []
+    indices: dict[str, int] = {}
+    code: list[int] = []
+
+    # Find the sub-propositions which appear more than once as the same
+    # object, without walking into any of them more than once.
+    seen: set[int] = set()
+    shared: set[int] = set()
+    unvisited: list[Proposition] = [prop]
+    while unvisited:
+        node = unvisited.pop()
+        if id(node) in seen:
+            shared.add(id(node))
+        else:
+            seen.add(id(node))
+            unvisited += node
+    # Index of the saved value of each shared sub-proposition compiled so far.
+    saved: dict[int, int] = {}
+
+    # Stack of the work left to do; a proposition is yet to be compiled and an
+    # instruction is yet to be emitted (after the operands have been compiled).
+    todo: list[Union[Proposition, tuple[int, int]]] = [prop]
+    while todo:
+        item = todo.pop()
+        if isinstance(item, tuple):
+            op, arg = item
+            if op == _STORE:
+                saved[arg] = len(saved)
+                arg = saved[arg]
+            code += (op, arg)
+            continue
+        # Dispatch on the opcode of the class, which is much faster than
+        # isinstance() with the (abstract) proposition classes
+        opcode: Optional[int] = getattr(item, "_opcode", None)
+        if opcode == _LOAD:
+            name: str = item.name  # type: ignore[attr-defined]
+            index = indices.get(name)
+            if index is None:
+                index = indices[name] = len(names)
+                names.append(name)
+            code += (_LOAD, index)
+        elif id(item) in saved:
+            code += (_FETCH, saved[id(item)])
+        elif opcode is not None:
+            if id(item) in shared:
+                todo.append((_STORE, id(item)))
+            operands = _operands(item, shared)  # type: ignore[arg-type]
+            if len(operands) > 2:
+                todo.append((_n_ary[opcode], len(operands)))
+            else:
+                todo.append((opcode, 0))
+            todo += reversed(operands)
+        else:
+            raise TypeError(f"Cannot compile {type(item).__name__}")
+
+    return _Program(tuple(names), tuple(code))
+
+
+def _operands(
+    prop: Union["_LogicOp1", "_LogicOp2"], shared: set[int], /
+) -> list[Proposition]:
+    """Returns the operands of the given proposition in order. If it is a
+    conjunction or a disjunction, the operands of the chain of the same
+    operation are returned instead; for example, `(P & Q) & (R & S)` gives
+    `P, Q, R, S`.
+
+    Sub-propositions in `shared` are not flattened into the chain, as their
+    truth values are saved by the program.
+    """
+    if prop._opcode not in _n_ary:
+        return list(prop)
+    operands: list[Proposition] = []
+    todo: list[Proposition] = list(reversed(tuple(prop)))
+    while todo:
+        item = todo.pop()
+        if type(item) is type(prop) and id(item) not in shared:
+            todo += reversed(tuple(item))
+        else:
+            operands.append(item)
+    return operands
+
+
+def _lookup(
+    names: Sequence[str], interpretation: Mapping[str, bool], /
+) -> list[bool]:
+    """Returns the truth values of the given predicate names in the given
+    interpretation, converted with `bool()`, so that every way of
+    interpreting a proposition gives the same result for values which are
+    not booleans. Raises `ValueError` when one of them is not assigned, that
+    is, when it is missing or is mapped to `None`."""
+    values: list[bool] = []
+    try:
+        for name in names:
+            value = interpretation[name]
+            if value is None:
+                break
+            values.append(bool(value))
+        else:
+            return values
+    except KeyError:
+        pass
+    raise ValueError(f"Predicate '{name}' not unassigned when interpreting")
+
+
+def _run(code: Sequence[int], values: Sequence[bool], /) -> bool:
+    """Runs the instructions of a compiled program, given the truth values of
+    its predicates, and returns the resulting truth value."""
+    stack: list[bool] = []
+    saved: list[bool] = []
+    instructions = iter(code)
+    for op, arg in zip(instructions, instructions):
+        if op == _LOAD:
+            stack.append(values[arg])
+        elif op == _NOT:
+            stack[-1] = not stack[-1]
+        elif op == _STORE:
+            saved.append(stack[-1])
+        elif op == _FETCH:
+            stack.append(saved[arg])
+        elif op == _ALL:
+            stack[-arg:] = (all(stack[-arg:]),)
+        elif op == _ANY:
+            stack[-arg:] = (any(stack[-arg:]),)
+        else:
+            b = stack.pop()
+            a = stack[-1]
+            if op == _AND:
+                stack[-1] = a & b
+            elif op == _OR:
+                stack[-1] = a | b
+            elif op == _IMPLIES:
+                # False < True, so a <= b is false only when a and not b
+                stack[-1] = a <= b
+            else:
+                stack[-1] = a is b
+    return stack.pop()
+
+
+def _run_packed(code: Sequence[int], values: Sequence[int], mask: int) -> int:
+    """Runs the instructions of a compiled program over many interpretations
+    at once, with the truth values of each predicate packed into the bits of
+    an integer, and returns the resulting packed truth values.
+
+    `mask` has a bit set for every interpretation.
+    """
+    stack: list[int] = []
+    saved: list[int] = []
+    instructions = iter(code)
+    for op, arg in zip(instructions, instructions):
+        if op == _LOAD:
+            stack.append(values[arg])
+        elif op == _NOT:
+            stack[-1] ^= mask
+        elif op == _STORE:
+            saved.append(stack[-1])
+        elif op == _FETCH:
+            stack.append(saved[arg])
+        elif op == _ALL:
+            stack[-arg:] = (reduce(and_, stack[-arg:]),)
+        elif op == _ANY:
+            stack[-arg:] = (reduce(or_, stack[-arg:]),)
+        else:
+            b = stack.pop()
+            a = stack[-1]
+            if op == _AND:
+                stack[-1] = a & b
+            elif op == _OR:
+                stack[-1] = a | b
+            elif op == _IMPLIES:
+                stack[-1] = (a ^ mask) | b
+            else:
+                stack[-1] = a ^ b ^ mask
+    return stack.pop()
+
+
+# Templates of the expressions generated for the binary opcodes.
+_templates: dict[int, str] = {
+    _AND: "{} & {}",
+    _OR: "{} | {}",
+    _IMPLIES: "{} <= {}",
+    _IFF: "{} is {}",
+}
+
+# Functions generated for the n-ary opcodes, and their binary opcodes.
+_n_ary_functions: dict[int, str] = {_ALL: "all", _ANY: "any"}
+_n_ary_binary: dict[int, int] = {_ALL: _AND, _ANY: _OR}
+
+# Maximum depth of the expressions nested in a generated function.
+_MAX_DEPTH = 16
+
+
+def _generate(program: _Program, /) -> Callable[[Mapping[str, bool]], bool]:
+    """Generates a Python function which runs the given program, given a
+    mapping from predicate names to truth values.
+
+    The instructions are nested into expressions, but only up to a limited
+    depth, past which the value is assigned to a variable so that deep
+    propositions do not run into the limits of the Python parser. Saved
+    values are assigned to variables as well. For example, the program of
+    `(P & Q) | ~P` generates the following function:
+
+    ```
+    def interpret(i, /):
+        try:
+            p0 = i['P']
+            p1 = i['Q']
+        except KeyError:
+            _lookup(names, i)
+            raise
+        if p0.__class__ is not bool or p1.__class__ is not bool:
+            p0, p1, = _lookup(names, i)
+        return (p0 & p1) | (not p0)
+    ```
+
+    Values which are not booleans are converted by `_lookup`, like they are
+    when interpreting, so that the function gives the same results.
+    """
+    lines = ["def interpret(i, /):", "    try:"]
+    lines += [
+        f"        p{k} = i[{name!r}]" for k, name in enumerate(program.names)
+    ]
+    # The lookup is repeated to raise the ValueError for the missing name,
+    # or to convert values which are not booleans
+    variables = [f"p{k}" for k in range(len(program.names))]
+    not_bool = " or ".join(f"{p}.__class__ is not bool" for p in variables)
+    lines += [
+        "    except KeyError:",
+        "        _lookup(names, i)",
+        "        raise",
+        f"    if {not_bool}:",
+        f"        {', '.join(variables)}, = _lookup(names, i)",
+    ]
+
+    def assign(expr: str) -> str:
+        """Adds an assignment of the expression to a new variable, and
+        returns the name of the variable."""
+        variable = f"t{len(lines)}"
+        lines.append(f"    {variable} = {expr}")
+        return variable
+
+    def operand(item: tuple[str, int]) -> str:
+        """Returns the expression of a stack item, parenthesized unless it is
+        a variable."""
+        return f"({item[0]})" if item[1] else item[0]
+
+    # Expressions of the values on the stack, with their nesting depths (zero
+    # for variables), and names of the variables of the saved values.
+    stack: list[tuple[str, int]] = []
+    saved: list[str] = []
+    instructions = iter(program.code)
+    for op, arg in zip(instructions, instructions):
+        if op == _LOAD:
+            stack.append((f"p{arg}", 0))
+        elif op == _STORE:
+            if stack[-1][1]:
+                stack[-1] = (assign(stack[-1][0]), 0)
+            saved.append(stack[-1][0])
+        elif op == _FETCH:
+            stack.append((saved[arg], 0))
+        else:
+            count = 1 if op == _NOT else 2 if op in _templates else arg
+            operands = stack[-count:]
+            del stack[-count:]
+            depth = count + max(item[1] for item in operands)
+            if op == _NOT:
+                expr = f"not {operand(operands[0])}"
+            elif op in _templates:
+                expr = _templates[op].format(*map(operand, operands))
+            elif depth <= _MAX_DEPTH:
+                # Short chains are joined with the binary operator, which is
+                # faster than calling all() or any()
+                operator = _templates[_n_ary_binary[op]].format("", "")
+                expr = operator.join(map(operand, operands))
+            else:
+                joined = ", ".join(item[0] for item in operands)
+                expr = f"{_n_ary_functions[op]}(({joined},))"
+                depth = 1 + max(item[1] for item in operands)
+            if depth > _MAX_DEPTH:
+                stack.append((assign(expr), 0))
+            else:
+                stack.append((expr, depth))
+    lines.append(f"    return {stack.pop()[0]}")
+
+    namespace: dict[str, Any] = {"_lookup": _lookup, "names": program.names}
+    exec("\n".join(lines), namespace)
+    return namespace["interpret"]
+
+
+# Table which translates the bytes 0 and 1 into binary digits.
+_binary_digits: bytes = bytes.maketrans(b"\x00\x01", b"01")
+
+# Bits of every byte as booleans, with the most significant bit first.
+_byte_bits: list[tuple[bool, ...]] = [
+    tuple(byte & (0x80 >> i) != 0 for i in range(8)) for byte in range(256)
+]
+
+
+def _unpack(packed: int, n: int, /) -> list[bool]:
+    """Returns the `n` lowest bits of `packed` as booleans, with the most
+    significant bit first.
+
+    The bits are unpacked a byte at a time through a table, rather than one
+    at a time.
+    """
+    size = (n + 7) >> 3
+    # Pad on the right so that the bits fill whole bytes
+    data = (packed << ((size << 3) - n)).to_bytes(size, "big")
+    bits: list[bool] = []
+    for byte in data:
+        bits += _byte_bits[byte]
+    del bits[n:]
+    return bits
+
+
+def _packed_columns(n: int, /) -> list[int]:
+    """Returns the columns of a truth table with `n` predicates, packed into
+    integers with the first row as the most significant bit.
+
+    Within the columns, the first predicate varies the slowest, and *true*
+    comes before *false*.
+    """
+    columns: list[int] = []
+    rows = 1 << n
+    for i in range(n):
+        # A block is one period of the column: true for the first half and
+        # false for the second. The block is then doubled up to every row.
+        half = rows >> (i + 1)
+        column = ((1 << half) - 1) << half
+        width = half << 1
+        while width < rows:
+            column |= column << width
+            width <<= 1
+        columns.append(column)
+    return columns
+
+
+def _equal(a: Proposition, b: Proposition, /) -> bool:
+    """Returns True if the two propositions are structurally equal.
+
+    The propositions are compared with an explicit stack rather than
+    recursion. Pairs of identical objects are skipped without being walked
+    into, and pairs whose cached hashes differ are known to be unequal.
+    """
+    todo: list[tuple[Proposition, Proposition]] = [(a, b)]
+    while todo:
+        a, b = todo.pop()
+        if a is b:
+            continue
+        if type(a) is not type(b):
+            return False
+        if getattr(a, "_opcode", None) == _LOAD:  # a predicate
+            if a.name != b.name:  # type: ignore[attr-defined]
+                return False
+            continue
+        hash_a = getattr(a, "_hash", None)
+        hash_b = getattr(b, "_hash", None)
+        if hash_a is not None and hash_b is not None and hash_a != hash_b:
+            return False
+        todo += zip(a, b)
+    return True
+
+
+def _hash(prop: Proposition, /) -> int:
+    """Computes, caches, and returns the hash of the given compound
+    proposition, along with those of its sub-propositions which are not
+    cached yet.
+
+    The hashes are computed with an explicit stack rather than recursion, from
+    the innermost sub-propositions outwards, so that the hash of each operand
+    is already cached when it is needed. The type is accounted for so that
+    objects such as Or(P, Q) and And(P, Q) do not have the same hash.
+    """
+    seen: set[int] = set()
+    # Stack of the work left to do; a proposition is yet to be walked into,
+    # unless it is paired with True, in which case its operands are done.
+    todo: list[tuple[Proposition, bool]] = [(prop, False)]
+    while todo:
+        item, done = todo.pop()
+        if done:
+            object.__setattr__(item, "_hash", hash((type(item), *item)))
+        elif not (
+            getattr(item, "_opcode", None) == _LOAD  # a predicate
+            or id(item) in seen
+            or hasattr(item, "_hash")
+        ):
+            seen.add(id(item))
+            todo.append((item, True))
+            todo += ((operand, False) for operand in item)
+    return prop._hash
+
+
+# The proposition classes are frozen, so their fields are set through
+# object.__setattr__. Their __init__ methods are written by hand rather than
+# generated by dataclass, and call it through this global, which is faster.
+_object_setattr = object.__setattr__
+
+
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class Predicate(Proposition):
     """Represents an [predicate][1] in formal logic. Currently,
     `classical-logic` only supports nullary (0-argument) predicates, which are
     used to serve as [propositional variables][2].
 
     When creating a new instance, if the given name is not valid, a
-    [`ValueError`][ValueError] is raised.
+    [`ValueError`][ValueError] is raised, or a [`TypeError`][TypeError] if it
+    is not a string.
+
+    Predicates are interned: creating a predicate with the same name as an
+    existing one returns the existing instance, so `Predicate('P') is
+    Predicate('P')`.
 
     [1]: https://en.wikipedia.org/wiki/Predicate_(mathematical_logic)
     [2]: https://en.wikipedia.org/wiki/Propositional_variable
@@ -505,11 +1160,57 @@ class Predicate(Proposition):
         name (str): The name of the predicate.
     """
 
+    __slots__ = ("name",)
+
     name: str
 
-    def __post_init__(self):
-        if not _ident_pattern.fullmatch(self.name):
-            raise ValueError(f"Invalid predicate name: {self.name!r}")
+    _opcode: ClassVar[int] = _LOAD
+
+    _instances: ClassVar[
+        "WeakValueDictionary[str, Predicate]"
+    ] = WeakValueDictionary()
+    """Table of the existing predicates, by name."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each subclass has a table of its own, so that creating a predicate
+        # always returns an instance of the class it is created with
+        cls._instances = WeakValueDictionary()
+
+    def __new__(cls, name: str) -> "Predicate":
+        self = cls._instances.get(name)
+        if self is None:
+            if not isinstance(name, str):
+                raise TypeError(
+                    f"Predicate name must be a str, not {type(name).__name__}"
+                )
+            # Only names which have not been seen before need validating. An
+            # ASCII identifier is exactly [a-zA-Z_][a-zA-Z0-9_]*
+            if not (name.isidentifier() and name.isascii()):
+                raise ValueError(f"Invalid predicate name: {name!r}")
+            self = super().__new__(cls)
+            # Interned names are found by identity in the interpretations,
+            # whose keys are usually interned (literals and keyword
+            # arguments), instead of being compared character by character
+            _object_setattr(self, "name", sys.intern(str(name)))
+            cls._instances[name] = self
+        return self
+
+    def __init__(self, name: str) -> None:
+        # The name is set by __new__, only when the predicate is created
+        pass
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.name))
+
+    def __reduce__(self) -> tuple[type["Predicate"], tuple[str]]:
+        # Goes through __new__ so that unpickled predicates are interned too
+        return (type(self), (self.name,))
 
     def __getitem__(self, index: int, /) -> NoReturn:
         raise IndexError(
@@ -517,25 +1218,21 @@ class Predicate(Proposition):
         )
 
     def __iter__(self, /) -> Iterator[Proposition]:
+        # The empty tuple is a shared constant, so this only creates a tuple
+        # iterator, which is cheaper to create than an empty generator
         return iter(())
 
     def degree(self, /) -> int:
         return 0
 
-    def _interpret(self, interpretation: Mapping[str, bool], /) -> bool:
-        if (truth_value := interpretation.get(self.name)) is not None:
-            return truth_value
-        raise ValueError(
-            f"Predicate '{self.name}' not unassigned when interpreting"
-        )
-
-    def _explicit_str(self) -> str:
+    def __str__(self) -> str:
         return self.name
 
-    __str__ = _explicit_str
+    def _str_parts(self, explicit: bool, /) -> tuple[str]:
+        return (self.name,)
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class _LogicOp1(Proposition):
     """Represents a unary (one-place) operation using a
     [logical connective][1].
@@ -546,21 +1243,48 @@ class _LogicOp1(Proposition):
         inner (Proposition): Inner operand.
     """
 
+    __slots__ = ("inner",)
+
     inner: Proposition
 
+    def __init__(self, inner: Proposition) -> None:
+        _object_setattr(self, "inner", inner)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return _equal(self, other)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            return _hash(self)
+
+    def __reduce__(self) -> tuple[type["_LogicOp1"], tuple[Proposition]]:
+        # Only the operand is pickled, leaving out the cached attributes
+        return (type(self), (self.inner,))
+
     def __getitem__(self, index: int, /) -> "Proposition":
         if index == 0:
             return self.inner
         raise IndexError(f"Expected 0; got {index}")
 
     def __iter__(self, /) -> Iterator["Proposition"]:
-        return iter((self.inner,))
+        yield self.inner
+
+    @property
+    @abstractmethod
+    def _opcode(self) -> int:
+        """Opcode of this operation in a compiled program."""
 
     def degree(self) -> int:
         return 1
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class Not(_LogicOp1):
     """Represents a [logical negation][1], which is interpreted to be *true*
     just in the case that its operand is *false*.
@@ -578,16 +1302,19 @@ class Not(_LogicOp1):
         inner (Proposition): Inner operand.
     """
 
-    def _interpret(self, i: Mapping[str, bool], /) -> bool:
-        return not self.inner._interpret(i)
+    __slots__ = ()
 
-    def _explicit_str(self) -> str:
-        return f"~{self.inner}"
+    _opcode: ClassVar[int] = _NOT
 
-    __str__ = _explicit_str
+    def _str_parts(
+        self, explicit: bool, /
+    ) -> tuple[Union[Proposition, str], ...]:
+        if not explicit and isinstance(self.inner, _LogicOp2):
+            return ("~(", self.inner, ")")
+        return ("~", self.inner)
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class _LogicOp2(Proposition):
     """Represents a binary (two-place) operation using a
     [logical connective][1].
@@ -599,9 +1326,15 @@ class _LogicOp2(Proposition):
         right (Proposition): Right operand.
     """
 
+    __slots__ = ("left", "right")
+
     left: Proposition
     right: Proposition
 
+    def __init__(self, left: Proposition, right: Proposition) -> None:
+        _object_setattr(self, "left", left)
+        _object_setattr(self, "right", right)
+
     @property
     @abstractmethod
     def _operator(self) -> str:
@@ -612,6 +1345,17 @@ class _LogicOp2(Proposition):
     def _associative(self) -> bool:
         """True if this binary operation is associative, False otherwise."""
 
+    @property
+    @abstractmethod
+    def _opcode(self) -> int:
+        """Opcode of this binary operation in a compiled program."""
+
+    def __reduce__(
+        self,
+    ) -> tuple[type["_LogicOp2"], tuple[Proposition, Proposition]]:
+        # Only the operands are pickled, leaving out the cached attributes
+        return (type(self), (self.left, self.right))
+
     def __getitem__(self, index: int, /) -> "Proposition":
         if index == 0:
             return self.left
@@ -620,45 +1364,50 @@ class _LogicOp2(Proposition):
         raise IndexError(f"Expected 0 or 1; got {index}")
 
     def __iter__(self, /) -> Iterator["Proposition"]:
-        return iter((self.left, self.right))
+        yield self.left
+        yield self.right
 
     def degree(self) -> int:
         return 2
 
-    def __str__(self) -> str:
-        a: str
+    def _str_parts(
+        self, explicit: bool, /
+    ) -> tuple[Union[Proposition, str], ...]:
+        operator = f" {self._operator} "
+        if explicit:
+            return ("(", self.left, operator, self.right, ")")
+
+        a: tuple[Union[Proposition, str], ...]
         if self._associative and type(self.left) is type(self):
-            a = str(self.left)
+            a = (self.left,)
         elif isinstance(self.left, _LogicOp2):
-            a = f"({self.left})"
+            a = ("(", self.left, ")")
         else:
-            a = str(self.left)
+            a = (self.left,)
 
-        b: str
+        b: tuple[Union[Proposition, str], ...]
         if isinstance(self.right, _LogicOp2):
-            b = f"({self.right})"
+            b = ("(", self.right, ")")
         else:
-            b = str(self.right)
+            b = (self.right,)
 
-        return f"{a} {self._operator} {b}"
+        return (*a, operator, *b)
 
-    def _explicit_str(self) -> str:
-        a = self.left._explicit_str()
-        b = self.right._explicit_str()
-        return f"({a} {self._operator} {b})"
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return _equal(self, other)
 
-    # This __hash__ method is commented out because it isn't overriding the
-    # generated __hash__ for some reason.
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            return _hash(self)
 
-    # Overridden hash to account for the object type in computing a hash, for
-    # efficiency. This is done because under the default generated __hash__,
-    # objects such as Or(P, Q) and And(P, Q) would have the same hash despite
-    # being different classes.
-    # def __hash__(self) -> int:
-    #    return hash((type(self), self.left, self.right))
 
-
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class And(_LogicOp2):
     """Represents a [logical conjunction][1], which is interpreted to be *true*
     just in the case that *both of its operands are true*.
@@ -679,14 +1428,14 @@ class And(_LogicOp2):
         right (Proposition): Right conjunct.
     """
 
+    __slots__ = ()
+
     _associative: ClassVar[bool] = True
     _operator: ClassVar[str] = "&"
-
-    def _interpret(self, i: Mapping[str, bool], /) -> bool:
-        return self.left._interpret(i) & self.right._interpret(i)
+    _opcode: ClassVar[int] = _AND
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class Or(_LogicOp2):
     """Represents a [logical disjunction][1], which is interpreted to be *true*
     just in the case that *at least one of its operands is true*.
@@ -707,14 +1456,14 @@ class Or(_LogicOp2):
         right (Proposition): Right disjunct.
     """
 
+    __slots__ = ()
+
     _associative: ClassVar[bool] = True
     _operator: ClassVar[str] = "|"
-
-    def _interpret(self, i: Mapping[str, bool], /) -> bool:
-        return self.left._interpret(i) | self.right._interpret(i)
+    _opcode: ClassVar[int] = _OR
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class Implies(_LogicOp2):
     """Represents a [logical material conditional][1], which is interpreted to
     be *true* just in the case *its first operand is false or both of its
@@ -736,14 +1485,14 @@ class Implies(_LogicOp2):
         right (Proposition): Consequent.
     """
 
+    __slots__ = ()
+
     _associative: ClassVar[bool] = False
     _operator: ClassVar[str] = "->"
+    _opcode: ClassVar[int] = _IMPLIES
 
-    def _interpret(self, i: Mapping[str, bool], /) -> bool:
-        return (not self.left._interpret(i)) | self.right._interpret(i)
 
-
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, eq=False, init=False)
 class Iff(_LogicOp2):
     """Represents a [logical biconditional][1], which is interpreted to be
     *true* just in the case that *both of its operands share the same truth
@@ -765,8 +1514,14 @@ class Iff(_LogicOp2):
         right (Proposition): Right operand.
     """
 
+    __slots__ = ()
+
     _associative: ClassVar[bool] = True
     _operator: ClassVar[str] = "<->"
+    _opcode: ClassVar[int] = _IFF
+
 
-    def _interpret(self, i: Mapping[str, bool], /) -> bool:
-        return self.left._interpret(i) is self.right._interpret(i)
+# The concrete proposition types. Checking the type of an object against these
+# is much faster than isinstance() with the abstract Proposition class, which
+# goes through ABCMeta.__instancecheck__.
+_types: frozenset[type] = frozenset({Predicate, Not, And, Or, Implies, Iff})
@@ -58,8 +58,9 @@ This concludes the grammar specification.
 [1]: https://docs.python.org/3/reference/introduction.html#notation
 """
 
-from typing import Generator, Iterator, Optional
-from enum import Enum, auto
+import re
+from functools import lru_cache
+from typing import Callable, NoReturn, Optional
 
 from .core import And, Predicate, Iff, Implies, Not, Or, Proposition
 
@@ -89,170 +90,196 @@ def _unexp_token(token_value: str) -> str:
 #
 
 
-class _TokenType(Enum):
-    IDENT = auto()
-    NOT = auto()
-    AND = auto()
-    OR = auto()
-    IMPLIES = auto()
-    IFF = auto()
-    LPARENS = auto()
-    RPARENS = auto()
+# Token types. Plain ints are used rather than an Enum, since comparing them
+# and looking them up as module globals is faster.
+(
+    _TT_IDENT,
+    _TT_NOT,
+    _TT_AND,
+    _TT_OR,
+    _TT_IMPLIES,
+    _TT_IFF,
+    _TT_LPARENS,
+    _TT_RPARENS,
+    _TT_ERROR,  # an unexpected character; only produced by _scan
+    _TT_END,  # the end of the string; only used by _parse
+) = range(10)
+
+
+_TOKEN_PATTERN: "re.Pattern[str]" = re.compile(
+    r"[ \t\f\r\n]*"
+    r"(?:([A-Za-z_]\w*)|(<->|->|[~&|()])|(\w+)|([^ \t\f\r\n]))"
+)
+"""Pattern matching one token and the whitespace before it.
+
+Group 1 is an identifier starting with an ASCII letter or an underscore, which
+is the common case. Group 2 is an operator or separator. Group 3 is any other
+run of word characters; it is an identifier if its first character is a
+letter, and otherwise its first character is an error (`\\w` also matches
+digits and other numeric characters, which cannot start an identifier, and
+which the pattern cannot tell apart from letters). Group 4 is any other
+character, which is an error."""
+
+_SYMBOLS: dict[str, tuple[int, str]] = {
+    value: (token_type, value)
+    for value, token_type in [
+        ("~", _TT_NOT),
+        ("&", _TT_AND),
+        ("|", _TT_OR),
+        ("->", _TT_IMPLIES),
+        ("<->", _TT_IFF),
+        ("(", _TT_LPARENS),
+        (")", _TT_RPARENS),
+    ]
+}
+"""The operator and separator tokens, by value. These are shared by every
+string lexed, so that no tuple is created for them."""
+
+
+def _scan(text: str) -> list[tuple[int, str]]:
+    """Returns the tokens of the given string (according to the grammar
+    specified in the module docstring), up to and including an `ERROR` token
+    for the first unexpected character, if there is one. The error itself is
+    raised by `_lex_error`, so that the parser can raise it only once it
+    reaches that token."""
+
+    tokens: list[tuple[int, str]] = []
+    for ident, symbol, word, _ in _TOKEN_PATTERN.findall(text):
+        if ident:
+            tokens.append((_TT_IDENT, ident))
+        elif symbol:
+            tokens.append(_SYMBOLS[symbol])
+        elif word[:1].isalpha():
+            tokens.append((_TT_IDENT, word))
+        else:  # an unexpected character, possibly at the start of `word`
+            tokens.append((_TT_ERROR, ""))
+            break
+    return tokens
+
+
+def _lex_error(text: str) -> NoReturn:
+    """Raises the `ValueError` for the first character in `text` which does
+    not start a token."""
+
+    for match in _TOKEN_PATTERN.finditer(text):
+        word = match[3]
+        if word is not None and not word[0].isalpha():
+            raise ValueError(_unexp_char(word[0]))
+        c = match[4]
+        if c is not None:
+            if c in "<-":
+                # An incomplete arrow; find the character after it which
+                # does not fit. If there is none, the string ended early,
+                # since a complete arrow would have been matched as one.
+                arrow = "<->" if c == "<" else "->"
+                i = match.end()
+                for expected in arrow[1:]:
+                    if i == len(text):
+                        break
+                    if text[i] != expected:
+                        raise ValueError(_unexp_char(text[i]))
+                    i += 1
+                raise ValueError(_UNEXP_END_OF_STR)
+            raise ValueError(_unexp_char(c))
+    raise AssertionError("unreachable")
 
 
-def _lex(text: str) -> Generator[tuple[_TokenType, str], None, None]:
-    """Yields tokens from lexing the given string (according to the grammar
-    specified in the module docstring).
+#
+# Parsing
+#
 
-    Raises a `ValueError` if the string ends unexpectedly or has an unexpected
-    character.
+_BINARY: dict[
+    int, tuple[int, Callable[[Proposition, Proposition], Proposition]]
+] = {
+    _TT_IFF: (1, Iff),
+    _TT_IMPLIES: (2, Implies),
+    _TT_OR: (3, Or),
+    _TT_AND: (4, And),
+}
+"""Precedence and constructor of each binary operator, by token type. The
+precedences correspond to the rules `bic`, `cond`, `disj`, and `conj`."""
+
+_Pending = tuple[
+    int, Optional[Callable[..., Proposition]], Optional[Proposition]
+]
+"""An operator waiting for its right operand while parsing: its precedence,
+its constructor, and its left operand (`None` for a prefix operator)."""
+
+_PENDING_NOT: _Pending = (5, Not, None)
+"""A pending negation, which takes precedence over every binary operator."""
+
+_PENDING_PARENS: _Pending = (0, None, None)
+"""A pending opening parenthesis. Its precedence is lower than that of every
+operator, so no operator before it is applied until it is closed."""
+
+_END: tuple[int, str] = (_TT_END, "")
+"""The token after the last token of a string."""
+
+
+@lru_cache(maxsize=1024)
+def _parse(text: str, /) -> Proposition:
+    """Parses a proposition. The results are cached by `prop`.
+
+    This is an operator-precedence parser for the grammar in the module
+    docstring. Operators which are still waiting for their right operand are
+    kept on a stack, instead of in the call stack of a recursive descent
+    parser, so that deeply nested text can be parsed. Errors are raised at
+    the same tokens as a recursive descent parser would.
     """
 
-    it: Iterator[str] = iter(text)
-    c: Optional[str] = next(it, None)
-
+    tokens = iter(_scan(text))
+    pending: list[_Pending] = []
     while True:
-        if c is None:  # end of string
-            return
-
-        elif c == "~":
-            yield (_TokenType.NOT, "~")
-
-        elif c == "&":
-            yield (_TokenType.AND, "&")
-
-        elif c == "|":
-            yield (_TokenType.OR, "|")
-
-        elif c == "-":
-            _lex_accept(it, ">")
-            yield (_TokenType.IMPLIES, "->")
-
-        elif c == "<":
-            _lex_accept(it, "-")
-            _lex_accept(it, ">")
-            yield (_TokenType.IFF, "<->")
-
-        elif c == "(":
-            yield (_TokenType.LPARENS, "(")
-
-        elif c == ")":
-            yield (_TokenType.RPARENS, ")")
-
-        elif c in " \t\f\r\n":  # whitespace
-            pass
-
-        elif c.isalpha() or c == "_":
-            parts = [c]
-            c = next(it, None)
-            while c is not None and (c.isalnum() or c == "_"):
-                parts.append(c)
-                c = next(it, None)
-            yield (_TokenType.IDENT, "".join(parts))
-            continue  # to skip advancing the iterator
-
+        # Before an operand: any negations and opening parentheses
+        token_type, value = next(tokens, _END)
+        while token_type == _TT_NOT or token_type == _TT_LPARENS:
+            pending.append(
+                _PENDING_NOT if token_type == _TT_NOT else _PENDING_PARENS
+            )
+            token_type, value = next(tokens, _END)
+        if token_type != _TT_IDENT:
+            _unexpected(text, token_type, value)
+        operand: Proposition = Predicate(value)
+
+        # After an operand: any closing parentheses, then a binary operator
+        # or the end of the string. The pending operators which take
+        # precedence over what follows are applied to the operand first; the
+        # operators are left-associative, so this includes those of the same
+        # precedence.
+        token_type, value = next(tokens, _END)
+        while True:
+            operator = _BINARY.get(token_type)
+            precedence = 1 if operator is None else operator[0]
+            while pending and pending[-1][0] >= precedence:
+                # Only parentheses have no constructor, and they are never
+                # applied, since their precedence is zero
+                _, constructor, left = pending.pop()
+                if left is None:
+                    operand = constructor(operand)  # type: ignore[misc]
+                else:
+                    operand = constructor(left, operand)  # type: ignore[misc]
+            if token_type != _TT_RPARENS or not pending:
+                break
+            pending.pop()  # the matching opening parenthesis
+            token_type, value = next(tokens, _END)
+
+        if operator is not None:
+            pending.append((precedence, operator[1], operand))
+        elif token_type == _TT_END and not pending:
+            return operand
         else:
-            raise ValueError(_unexp_char(c))
-
-        c = next(it, None)
+            _unexpected(text, token_type, value)
 
 
-def _lex_accept(it: Iterator[str], expected: str) -> None:
-    """Gets the next char from `it` and raises `ValueError` if the char is not
-    equal to `expected`.
-    """
-
-    c = next(it, None)
-    if c is None:
+def _unexpected(text: str, token_type: int, value: str, /) -> NoReturn:
+    """Raises the `ValueError` for the given token of `text` being
+    unexpected."""
+    if token_type == _TT_ERROR:
+        _lex_error(text)
+    elif token_type == _TT_END:
         raise ValueError(_UNEXP_END_OF_STR)
-    if c != expected:
-        raise ValueError(_unexp_char(c))
-
-
-#
-# Parsing
-#
-
-
-class _Parser:
-    def __init__(self, text: str, /):
-        self._token_stream: Iterator[tuple[_TokenType, str]] = _lex(text)
-        """Iterator over the tokens to parse."""
-
-        self._current_token_type: Optional[_TokenType]
-        self._current_token_value: str
-
-        self._current_token_type, self._current_token_value = next(
-            self._token_stream
-        )
-
-    def _advance(self) -> None:
-        """Advances to the next token."""
-        self._current_token_type, self._current_token_value = next(
-            self._token_stream, (None, "")
-        )
-
-    def current_token(self) -> tuple[Optional[_TokenType], str]:
-        """Returns the current token this parser is on. Returns `(None, "")`
-        if there is no next token."""
-        return self._current_token_type, self._current_token_value
-
-    def bic(self) -> Proposition:
-        """Parses rule `bic`."""
-        out = self.cond()
-        while self._current_token_type is _TokenType.IFF:
-            self._advance()
-            out = Iff(out, self.cond())
-        return out
-
-    def cond(self) -> Proposition:
-        """Parses rule `cond`."""
-        out = self.disj()
-        while self._current_token_type is _TokenType.IMPLIES:
-            self._advance()
-            out = Implies(out, self.disj())
-        return out
-
-    def disj(self) -> Proposition:
-        """Parses rule `disj`."""
-        out = self.conj()
-        while self._current_token_type is _TokenType.OR:
-            self._advance()
-            out = Or(out, self.conj())
-        return out
-
-    def conj(self) -> Proposition:
-        """Parses rule `conj`."""
-        out = self.unit()
-        while self._current_token_type is _TokenType.AND:
-            self._advance()
-            out = And(out, self.unit())
-        return out
-
-    def unit(self) -> Proposition:
-        """Parses rule `unit`"""
-        if self._current_token_type is _TokenType.IDENT:
-            p = Predicate(self._current_token_value)
-            self._advance()
-            return p
-
-        elif self._current_token_type is _TokenType.NOT:
-            self._advance()
-            return Not(self.unit())
-
-        elif self._current_token_type is _TokenType.LPARENS:
-            self._advance()
-            prop = self.bic()
-            if self._current_token_type is _TokenType.RPARENS:
-                self._advance()
-                return prop
-            # falls through to raise error
-
-        if self._current_token_type is None:
-            raise ValueError(_UNEXP_END_OF_STR)
-
-        else:
-            raise ValueError(_unexp_token(self._current_token_value))
+    else:
+        raise ValueError(_unexp_token(value))
 
 
 #
@@ -277,13 +304,12 @@ def prop(text: str, /) -> Proposition:
         v = cl.prop('P & Q | R')
         w = cl.prop('(P -> Q) <-> R')
         ```
+
+    Recently parsed strings are cached, so parsing the same string again
+    returns the same proposition object. (Propositions are immutable, so
+    this is safe to share.)
     """
-    parser = _Parser(text)
-    result = parser.bic()
-    token_type, token_value = parser.current_token()
-    if token_type is not None:  # if it didn't reach the end
-        raise ValueError(_unexp_token(token_value))
-    return result
+    return _parse(text)
 
 
 def props(text: str, /) -> tuple[Proposition, ...]:
@@ -312,4 +338,4 @@ def props(text: str, /) -> tuple[Proposition, ...]:
         #   ps = cl.props('  ')
         ```
     """
-    return tuple(prop(s) for s in text.split(","))
+    return tuple(map(prop, text.split(",")))
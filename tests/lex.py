@@ -3,7 +3,7 @@
 
 import sys
 
-from classical_logic.parsing import _lex as lex
+from classical_logic.parsing import _TT_ERROR, _lex_error, _scan
 
 
 def main() -> None:
@@ -18,8 +18,9 @@ def main() -> None:
 
     text = sys.argv[1]
 
-    tokens = lex(text)
-    for token in tokens:
+    for token in _scan(text):
+        if token[0] == _TT_ERROR:
+            _lex_error(text)
         print(token)
 
 
@@ -2,10 +2,15 @@
 
 import ast
 from collections.abc import Mapping
+import copy
+import dataclasses
+import itertools
+import pickle
 import re
 import pytest
 import string
-from typing import Iterator
+import sys
+from typing import Any, Iterator
 
 from classical_logic.core import (
     And,
@@ -19,16 +24,16 @@ from classical_logic.core import (
 from classical_logic.parsing import prop
 
 
-simple5: list[Proposition] = [
+simple5: tuple[Proposition, ...] = (
     Not(Predicate("p")),
     And(Predicate("p"), Predicate("q")),
     Or(Predicate("p"), Predicate("q")),
     Implies(Predicate("p"), Predicate("q")),
     Iff(Predicate("p"), Predicate("q")),
-]
+)
 # [~p, p&q, p|q, p->q, p<->q]
 
-simple6: list[Proposition] = [Predicate("p"), *simple5]
+simple6: tuple[Proposition, ...] = (Predicate("p"), *simple5)
 # [p, ~p, p&q, p|q, p->q, p<->q]
 
 P = Predicate("P")
@@ -37,10 +42,10 @@ R = Predicate("R")
 S = Predicate("S")
 ALL_CHARS_PRED = Predicate(f"_{string.ascii_letters}{string.digits}")
 
-atomic_test_cases: list[Predicate] = [
+atomic_test_cases: tuple[Predicate, ...] = (
     Predicate("p"),
     Predicate("ANY_NamE"),
-]
+)
 
 
 def test_getitem():
@@ -58,25 +63,23 @@ def test_getitem():
     assert Iff(And(P, Q), Or(R, S))[0] == And(P, Q)
     assert Iff(And(P, Q), Or(R, S))[1] == Or(R, S)
 
+
+@pytest.mark.parametrize(
+    "u,index",
+    [
+        *[(P, i) for i in [0, 1, -1]],
+        *[(Not(P), i) for i in [1, 2, -1]],
+        *[
+            (u, i)
+            for u in [And(P, Q), Or(P, Q), Implies(P, Q), Iff(P, Q)]
+            for i in [2, 3, -1]
+        ],
+    ],
+)
+def test_getitem_index_error(u: Proposition, index: int):
+    """Tests that p[index] raises IndexError for an index out of range."""
     with pytest.raises(IndexError):
-        P[0]
-    with pytest.raises(IndexError):
-        P[1]
-    with pytest.raises(IndexError):
-        P[-1]
-    with pytest.raises(IndexError):
-        Not(P)[1]
-    with pytest.raises(IndexError):
-        Not(P)[2]
-    with pytest.raises(IndexError):
-        Not(P)[-1]
-    for cls in [And, Or, Implies, Iff]:
-        with pytest.raises(IndexError):
-            cls(P, Q)[2]
-        with pytest.raises(IndexError):
-            cls(P, Q)[3]
-        with pytest.raises(IndexError):
-            cls(P, Q)[-1]
+        u[index]
 
 
 def test_iter():
@@ -115,36 +118,48 @@ class TestComposition:
         assert ~u == Not(u)
 
     @pytest.mark.parametrize("u", samples)
-    def test_and(self, u: Proposition):
-        for v in self.samples:
-            assert u & v == And(u, v)
-        for x in [object(), True, False]:
-            with pytest.raises(TypeError):
-                u & x  # type: ignore
-            with pytest.raises(TypeError):
-                x & u  # type: ignore
+    @pytest.mark.parametrize("v", samples)
+    def test_and(self, u: Proposition, v: Proposition):
+        assert u & v == And(u, v)
+
+    @pytest.mark.parametrize("u", samples)
+    @pytest.mark.parametrize("v", samples)
+    def test_or(self, u: Proposition, v: Proposition):
+        assert u | v == Or(u, v)
 
     @pytest.mark.parametrize("u", samples)
-    def test_or(self, u: Proposition):
-        for v in self.samples:
-            assert u | v == Or(u, v)
-        for x in [object(), True, False]:
-            with pytest.raises(TypeError):
-                u | x  # type: ignore
-            with pytest.raises(TypeError):
-                x | u  # type: ignore
+    @pytest.mark.parametrize("v", samples)
+    def test_implies(self, u: Proposition, v: Proposition):
+        assert u.implies(v) == Implies(u, v)
 
     @pytest.mark.parametrize("u", samples)
-    def test_implies(self, u: Proposition):
-        for v in self.samples:
-            assert u.implies(v) == Implies(u, v)
-            assert v.implies(u) == Implies(v, u)
+    @pytest.mark.parametrize("v", samples)
+    def test_iff(self, u: Proposition, v: Proposition):
+        assert u.iff(v) == Iff(u, v)
 
     @pytest.mark.parametrize("u", samples)
-    def test_iff(self, u: Proposition):
-        for v in self.samples:
-            assert u.iff(v) == Iff(u, v)
-            assert v.iff(u) == Iff(v, u)
+    @pytest.mark.parametrize("x", [object(), True, False])
+    def test_and_or_non_proposition(self, u: Proposition, x: object):
+        """Tests that & and | are not defined with a non-proposition on
+        either side."""
+        with pytest.raises(TypeError):
+            u & x  # type: ignore
+        with pytest.raises(TypeError):
+            x & u  # type: ignore
+        with pytest.raises(TypeError):
+            u | x  # type: ignore
+        with pytest.raises(TypeError):
+            x | u  # type: ignore
+
+
+# Truth values which are not bools, for the predicates P, Q, and R
+non_bool_rows: tuple[tuple[object, ...], ...] = (
+    (1, 2, 3),
+    (1, True, "x"),
+    ("x", [1], 0),
+    (0, "", []),
+    (2.5, (), True),
+)
 
 
 class TestInterpreting:
@@ -204,6 +219,27 @@ class TestInterpreting:
         self.expect_interpret_value_error(p, {p.name + "2": True})
         self.expect_interpret_value_error(p, {p.name + "2": False})
 
+    def test_predicate_name_none(self):
+        """Tests that a predicate assigned to None is treated as unassigned,
+        whether interpreting, compiled, or interpreting many."""
+        u = And(P, Q)
+        self.expect_interpret_value_error(u, {"P": None, "Q": True})
+        self.expect_interpret_value_error(u, {"P": True, "Q": None})
+        with pytest.raises(ValueError):
+            u.compile()({"P": True, "Q": None})
+        with pytest.raises(ValueError):
+            u.interpret_many([{"P": True, "Q": True}, {"P": None, "Q": True}])
+
+    @pytest.mark.parametrize("row", non_bool_rows)
+    def test_non_bool_values(self, row: tuple[object, ...]):
+        """Tests that values other than bools are converted with bool()."""
+        i: dict[str, Any] = dict(zip("PQR", row))
+        p, q, r = map(bool, row)
+        assert self.interpret(And(And(P, Q), R), i) is (p and q and r)
+        assert self.interpret(Or(Or(P, Q), R), i) is (p or q or r)
+        assert self.interpret(Iff(P, Q), i) is (p == q)
+        assert self.interpret(Implies(P, R), i) is (not p or r)
+
     def test_not_truth_table(self):
         """Tests truth table of ~P."""
         u = Not(P)
@@ -242,6 +278,67 @@ class TestInterpreting:
         assert self.interpret(u, {"P": False, "Q": True}) is False
         assert self.interpret(u, {"P": False, "Q": False}) is True
 
+    def test_deep_nesting(self):
+        """Tests that deeply nested propositions can be interpreted without
+        exceeding the recursion limit."""
+        u: Proposition = P
+        for _ in range(10_000):
+            u = Not(u)
+        assert self.interpret(u, {"P": True}) is True
+        assert self.interpret(u, {"P": False}) is False
+
+        v: Proposition = P
+        for _ in range(10_000):
+            v = And(v, Q)
+        assert self.interpret(v, {"P": True, "Q": True}) is True
+        assert self.interpret(v, {"P": True, "Q": False}) is False
+        self.expect_interpret_value_error(v, {"P": True})
+
+    def test_shared_subpropositions(self):
+        """Tests that a sub-proposition shared as the same object is only
+        interpreted once, instead of once for every place it appears."""
+        u: Proposition = P
+        for _ in range(200):
+            u = Iff(Implies(u, Q), Or(u, Not(u)))
+        assert self.interpret(u, {"P": True, "Q": True}) is True
+        # Each level reduces to (u -> Q), so an even number of levels reduces
+        # to P | Q.
+        assert self.interpret(u, {"P": True, "Q": False}) is True
+        assert self.interpret(u, {"P": False, "Q": False}) is False
+        assert u.truth_table() == [True, True, True, False]
+        self.expect_interpret_value_error(u, {"P": True})
+
+    @pytest.mark.parametrize(
+        "u",
+        [
+            And(And(P, Q), And(R, S)),
+            Or(Or(Or(P, Q), R), S),
+            Or(P, Or(Q, Or(R, S))),
+            And(Or(And(P, Q), R), And(Or(Q, S), Not(P))),
+            Or(And(P, Q), Or(And(R, S), Or(Not(Q), P))),
+        ],
+    )
+    def test_chains(self, u: Proposition):
+        """Tests that chains of conjunctions and disjunctions are interpreted
+        the same way as their nested binary operations."""
+
+        def expected(v: Proposition, i: dict[str, bool]) -> bool:
+            if isinstance(v, Predicate):
+                return i[v.name]
+            elif isinstance(v, Not):
+                return not expected(v.inner, i)
+            elif isinstance(v, And):
+                return expected(v.left, i) and expected(v.right, i)
+            assert isinstance(v, Or)
+            return expected(v.left, i) or expected(v.right, i)
+
+        shared = Or(u, And(u, R))
+        for row in itertools.product([True, False], repeat=4):
+            i = dict(zip("PQRS", row))
+            assert self.interpret(u, i) is expected(u, i)
+            assert self.interpret(shared, i) is expected(shared, i)
+        self.expect_interpret_value_error(u, {"P": True, "Q": True})
+
     tautology_cases: list[Proposition] = [
         Or(P, Not(P)),  # P | ~P
         Implies(P, P),  # P -> P
@@ -262,12 +359,11 @@ class TestInterpreting:
     ]
 
     @pytest.mark.parametrize("u", tautology_cases)
-    def test_tautology(self, u: Proposition):
+    @pytest.mark.parametrize("p", [True, False])
+    @pytest.mark.parametrize("q", [True, False])
+    def test_tautology(self, u: Proposition, p: bool, q: bool):
         """Tests if the tautology holds true always."""
-        for p in [True, False]:
-            for q in [True, False]:
-                i = {"P": p, "Q": q}
-                assert self.interpret(u, i) is True
+        assert self.interpret(u, {"P": p, "Q": q}) is True
 
     contradiction_cases: list[Proposition] = [
         And(P, Not(P)),  # P & ~P
@@ -288,12 +384,11 @@ class TestInterpreting:
     ]
 
     @pytest.mark.parametrize("u", contradiction_cases)
-    def test_contradiction(self, u: Proposition):
+    @pytest.mark.parametrize("p", [True, False])
+    @pytest.mark.parametrize("q", [True, False])
+    def test_contradiction(self, u: Proposition, p: bool, q: bool):
         """Tests if the contradiction holds false always."""
-        for p in [True, False]:
-            for q in [True, False]:
-                i = {"P": p, "Q": q}
-                assert self.interpret(u, i) is False
+        assert self.interpret(u, {"P": p, "Q": q}) is False
 
     predicate_missing_cases: list[
         tuple[Proposition, list[dict[str, bool]]]
@@ -374,6 +469,190 @@ class TestInterpreting:
             self.expect_interpret_value_error(u, i)
 
 
+class TestTruthTable:
+    """Tests p.truth_table()."""
+
+    @pytest.mark.parametrize(
+        "u,expected",
+        [
+            (P, [True, False]),
+            (Not(P), [False, True]),
+            (And(P, Q), [True, False, False, False]),
+            (Or(P, Q), [True, True, True, False]),
+            (Implies(P, Q), [True, False, True, True]),
+            (Iff(P, Q), [True, False, False, True]),
+            (Or(P, Not(P)), [True, True]),
+            (And(Q, P), [True, False, False, False]),
+        ],
+    )
+    def test_default_names(self, u: Proposition, expected: list[bool]):
+        assert u.truth_table() == expected
+
+    @pytest.mark.parametrize(
+        "u",
+        [
+            P,
+            Not(P),
+            Iff(And(P, Q), Or(Not(P), R)),
+            Implies(Implies(Implies(P, Q), P), Q),
+            And(And(P, Q), And(R, S)),
+            Or(Or(P, Not(Q)), Or(R, And(S, P))),
+        ],
+    )
+    def test_matches_interpreting(self, u: Proposition):
+        names = ["R", "Q", "P", "S"]
+        rows = itertools.product([True, False], repeat=len(names))
+        expected = [u(dict(zip(names, row))) for row in rows]
+        assert u.truth_table(names) == expected
+
+    @pytest.mark.parametrize("u", TestInterpreting.tautology_cases)
+    def test_tautology(self, u: Proposition):
+        assert u.truth_table(["P", "Q"]) == [True] * 4
+
+    @pytest.mark.parametrize("u", TestInterpreting.contradiction_cases)
+    def test_contradiction(self, u: Proposition):
+        assert u.truth_table(["P", "Q"]) == [False] * 4
+
+    def test_many_names(self):
+        names = [f"x{i}" for i in range(8)]
+        u: Proposition = Predicate(names[0])
+        for name in names[1:]:
+            u = Iff(Implies(u, Predicate(name)), Not(Or(u, Predicate(name))))
+        rows = itertools.product([True, False], repeat=len(names))
+        expected = [u(dict(zip(names, row))) for row in rows]
+        assert u.truth_table(names) == expected
+
+    def test_missing_name(self):
+        with pytest.raises(ValueError):
+            And(P, Q).truth_table(["P"])
+        with pytest.raises(ValueError):
+            P.truth_table([])
+
+    def test_duplicate_name(self):
+        with pytest.raises(ValueError):
+            And(P, Q).truth_table(["P", "P", "Q"])
+        with pytest.raises(ValueError):
+            P.truth_table(["P", "Q", "Q"])
+
+
+class TestInterpretMany:
+    """Tests p.interpret_many()."""
+
+    @pytest.mark.parametrize(
+        "u",
+        [
+            P,
+            Not(P),
+            Iff(And(P, Q), Or(Not(P), R)),
+            Implies(Implies(Implies(P, Q), P), Q),
+            And(And(P, Q), And(R, Not(P))),
+        ],
+    )
+    def test_matches_interpreting(self, u: Proposition):
+        rows = itertools.product([True, False], repeat=4)
+        interps = [dict(zip("PQRS", row)) for row in rows]
+        interps += reversed(interps[3:])
+        expected = [u(i) for i in interps]
+        assert u.interpret_many(interps) == expected
+        assert u.interpret_many(interps[:1]) == expected[:1]
+        assert u.interpret_many([]) == []
+
+    def test_missing_name(self):
+        u = And(P, Q)
+        with pytest.raises(ValueError):
+            u.interpret_many([{"P": True, "Q": True}, {"P": True}])
+
+    def test_non_bool_values(self):
+        """Tests that values other than bools give the same results as
+        interpreting."""
+        u = Or(Implies(And(P, Q), Iff(P, R)), And(Q, Not(R)))
+        rows: list[dict[str, Any]] = [
+            dict(zip("PQR", row)) for row in non_bool_rows
+        ]
+        assert u.interpret_many(rows) == [u(r) for r in rows]
+
+
+class TestCompile:
+    """Tests p.compile()."""
+
+    @pytest.mark.parametrize(
+        "u",
+        [
+            Not(P),
+            Iff(And(P, Q), Or(Not(P), R)),
+            Implies(Implies(Implies(P, Q), P), Q),
+            Or(Iff(Q, Not(Q)), Implies(R, R)),
+            And(And(P, Q), And(R, Not(P))),
+            Or(Or(P, Not(Q)), Or(R, And(Q, P))),
+        ],
+    )
+    def test_matches_interpreting(self, u: Proposition):
+        names = ["P", "Q", "R"]
+        rows = list(itertools.product([True, False], repeat=len(names)))
+        expected = [u(dict(zip(names, row))) for row in rows]
+        f = u.compile()
+        assert [f(dict(zip(names, row))) for row in rows] == expected
+        assert u.compile() is f
+        # Calling the proposition uses the compiled function afterwards
+        assert [u(dict(zip(names, row))) for row in rows] == expected
+
+    def test_shared_subpropositions(self):
+        u: Proposition = P
+        for _ in range(200):
+            u = Iff(Implies(u, Q), Or(u, Not(u)))
+        f = u.compile()
+        assert f({"P": True, "Q": True}) is True
+        assert f({"P": True, "Q": False}) is True
+        assert f({"P": False, "Q": False}) is False
+
+    def test_deep_nesting(self):
+        u: Proposition = P
+        for _ in range(10_000):
+            u = And(Not(u), Q)
+        f = u.compile()
+        assert f({"P": True, "Q": True}) is True
+        assert f({"P": False, "Q": True}) is False
+        assert f({"P": False, "Q": False}) is False
+
+        v: Proposition = P
+        for _ in range(10_000):
+            v = Or(v, Not(Or(Q, v)))
+        g = Or(v, Or(Or(R, S), v)).compile()
+        assert g({"P": True, "Q": False, "R": False, "S": False}) is True
+        assert g({"P": False, "Q": True, "R": False, "S": False}) is False
+        assert g({"P": False, "Q": True, "R": False, "S": True}) is True
+
+    @pytest.mark.parametrize(
+        "u",
+        [
+            And(And(P, Q), R),
+            Or(Or(P, Q), R),
+            Iff(P, Q),
+            Implies(P, Q),
+            Or(Implies(And(P, Q), Iff(P, R)), And(Q, Not(R))),
+        ],
+    )
+    def test_non_bool_values(self, u: Proposition):
+        """Tests that values other than bools give the same results before
+        and after compiling."""
+        rows: list[dict[str, Any]] = [
+            dict(zip("PQR", row)) for row in non_bool_rows
+        ]
+        expected = [u(r) for r in rows]
+        assert all(type(b) is bool for b in expected)
+        u.compile()
+        assert [u(r) for r in rows] == expected
+
+    def test_missing_name(self):
+        u = And(P, Or(Q, R))
+        f = u.compile()
+        for i in [{}, {"P": True}, {"P": True, "R": False}]:
+            with pytest.raises(ValueError):
+                f(i)
+            with pytest.raises(ValueError):
+                u(i)
+
+
 class TestRepresentationAndFormatting:
     """Tests str(), repr(), and format()"""
 
@@ -388,6 +667,8 @@ class TestRepresentationAndFormatting:
         And(Iff(P, Not(Q)), Implies(Not(P), Q)),
         And(And(P, Q), R),
         And(P, And(Q, R)),
+        Not(And(P, Q)),
+        Or(Not(Iff(P, Q)), Not(Not(R))),
     ]
 
     @pytest.mark.parametrize("u", cases)
@@ -396,6 +677,21 @@ class TestRepresentationAndFormatting:
         # Parsing str(u) should return a proposition equal to u
         assert prop(str(u)) == u
 
+    def test_str_deep_nesting(self):
+        """Tests str(u) and format(u, "X") on deeply nested propositions."""
+        u: Proposition = P
+        for _ in range(10_000):
+            u = And(u, Not(Q))
+        assert str(u) == " & ".join(["P"] + ["~Q"] * 10_000)
+        assert format(u, "X") == "(" * 10_000 + "P" + " & ~Q)" * 10_000
+
+    def test_str_cached(self):
+        """Tests that str(u) is only built once."""
+        u = Or(And(P, Q), Not(Implies(R, S)))
+        assert str(u) is str(u)
+        assert format(u, "S") is str(u)
+        assert format(u, "X") == "((P & Q) | ~(R -> S))"
+
     @pytest.mark.parametrize("u", cases)
     def test_repr(self, u: Proposition):
         """Tests repr(u)"""
@@ -451,6 +747,70 @@ class TestHash:
         if hash(u) != hash(v):
             assert u != v
 
+    def test_eq(self):
+        """Tests that p == q checks for structural equality."""
+        assert And(Or(P, Q), Not(R)) == And(Or(P, Q), Not(R))
+        assert hash(And(Or(P, Q), Not(R))) == hash(And(Or(P, Q), Not(R)))
+        assert And(P, Q) != Or(P, Q)
+        assert Not(P) != Not(Q)
+        assert And(P, Q) != And(Q, P)
+        assert P != "P"
+
+    def test_hash_deep_nesting(self):
+        """Tests that hash(p) works on deeply nested propositions without
+        exceeding the recursion limit, and on widely shared ones without
+        walking into them more than once."""
+        u: Proposition = P
+        v: Proposition = P
+        for _ in range(10_000):
+            u = And(Not(u), Q)
+            v = And(Not(v), Q)
+        assert hash(u) == hash(v)
+        assert hash(u.left) == hash(v.left)
+
+        w: Proposition = P
+        for _ in range(200):
+            w = Iff(Implies(w, Q), Or(w, Not(w)))
+        assert hash(w) == hash(Iff(w.left, w.right))
+
+    def test_eq_deep_nesting(self):
+        """Tests that p == q compares deeply nested propositions without
+        exceeding the recursion limit."""
+        u: Proposition = P
+        v: Proposition = P
+        for _ in range(10_000):
+            u = And(Not(u), Q)
+            v = And(Not(v), Q)
+        assert u == v
+        assert u == u
+        assert u != And(Not(v), Q)
+        assert Or(u, Not(v)) != Or(v, Not(R))
+
+
+@pytest.mark.parametrize(
+    "u", [P, Not(P), And(P, Q), Or(Iff(P, Q), R), Implies(P, Not(Q))]
+)
+def test_slots(u: Proposition):
+    """Tests that propositions have no __dict__ and that the cached
+    attributes are not copied or pickled."""
+    assert not hasattr(u, "__dict__")
+    hash(u)
+    u.compile()
+    for v in [copy.copy(u), copy.deepcopy(u), pickle.loads(pickle.dumps(u))]:
+        assert v == u
+        assert hash(v) == hash(u)
+        assert str(v) == str(u)
+
+
+def test_dataclass_fields():
+    """Tests that the hand-written __init__ methods keep the dataclass
+    fields and keyword arguments."""
+    assert [f.name for f in dataclasses.fields(Not)] == ["inner"]
+    assert [f.name for f in dataclasses.fields(Iff)] == ["left", "right"]
+    assert Not(inner=P) == Not(P)
+    assert Or(left=P, right=Q) == Or(P, Q)
+    assert dataclasses.replace(And(P, Q), right=R) == And(P, R)
+
 
 class TestPredicateCreation:
     """Tests the creation of `Predicate` objects."""
@@ -467,6 +827,19 @@ class TestPredicateCreation:
         predicate = Predicate(name)
         assert predicate.name == name
 
+    @pytest.mark.parametrize("name", ["P", "aName", "_____"])
+    def test_interned(self, name: str):
+        predicate = Predicate(name)
+        assert Predicate(name) is predicate
+        assert Predicate(name=name) is predicate
+        assert copy.copy(predicate) is predicate
+        assert copy.deepcopy(predicate) is predicate
+        assert pickle.loads(pickle.dumps(predicate)) is predicate
+
+    def test_name_interned(self):
+        name = "".join(["interned", "Name"])
+        assert Predicate(name).name is sys.intern("internedName")
+
     @pytest.mark.parametrize(
         "name",
         [
@@ -477,8 +850,30 @@ class TestPredicateCreation:
             "123Cats",
             "Has  Spaces",
             "\uFFFF",
+            "\u00e9t\u00e9",
+            "P\n",
         ],
     )
     def test_invalid(self, name: str):
         with pytest.raises(ValueError):
             Predicate(name)
+
+    @pytest.mark.parametrize("name", [1, None, b"P", ["P"]])
+    def test_invalid_type(self, name: Any):
+        with pytest.raises(TypeError):
+            Predicate(name)
+
+    def test_subclass(self):
+        predicate = SubPredicate("P")
+        assert type(predicate) is SubPredicate
+        assert SubPredicate("P") is predicate
+        assert Predicate("P") is P
+        assert pickle.loads(pickle.dumps(predicate)) is predicate
+        assert copy.deepcopy(predicate) is predicate
+
+
+class SubPredicate(Predicate):
+    """Subclass of Predicate, for testing that its instances are interned
+    and pickled as its own."""
+
+    __slots__ = ()
@@ -14,9 +14,18 @@ from classical_logic.core import (
 )
 
 from classical_logic.parsing import (
-    _lex,
-    _lex_accept,
-    _TokenType,
+    _UNEXP_END_OF_STR,
+    _lex_error,
+    _scan,
+    _TT_AND,
+    _TT_ERROR,
+    _TT_IDENT,
+    _TT_IFF,
+    _TT_IMPLIES,
+    _TT_LPARENS,
+    _TT_NOT,
+    _TT_OR,
+    _TT_RPARENS,
     _unexp_char,
     prop,
     props,
@@ -25,59 +34,65 @@ from classical_logic.parsing import (
 
 class TestLex:
     @pytest.mark.parametrize(
-        "text",
+        "text,message",
         [
-            "abcd",
-            "sadfmsoerqwkef",
-            "\\'\"\n\t\uFFFF",
+            ("-<", _unexp_char("<")),
+            ("- >", _unexp_char(" ")),
+            ("<=", _unexp_char("=")),
+            ("<-=", _unexp_char("=")),
+            ("P <- Q", _unexp_char(" ")),
+            ("-", _UNEXP_END_OF_STR),
+            ("<", _UNEXP_END_OF_STR),
+            ("P <-", _UNEXP_END_OF_STR),
         ],
     )
-    def test_lex_accept(self, text: str):
-        """Tests _lex_accept"""
-
-        # Every corresponding character should be accepted
-        it = iter(text)
-        for c in text:
-            _lex_accept(it, c)
-
-        # Do it again but with wrong chars
-        it = iter(text)
-        for c in text:
-            d = chr(ord(c) + 1)
-            with pytest.raises(ValueError):
-                _lex_accept(it, d)
-
-        # Assert that any more characters will not be accepted
-        with pytest.raises(ValueError):
-            _lex_accept(it, "a")
-        with pytest.raises(ValueError):
-            _lex_accept(it, "b")
+    def test_incomplete_arrow(self, text: str, message: str):
+        """Tests the error raised for an incomplete arrow."""
+        with pytest.raises(ValueError) as exc_info:
+            prop(text)
+        assert str(exc_info.value) == message
 
     @pytest.mark.parametrize(
         "text,expected_token_type",
         [
             # Predicate names:
-            ("P", _TokenType.IDENT),
-            (f"_{string.ascii_letters}{string.digits}", _TokenType.IDENT),
+            ("P", _TT_IDENT),
+            (f"_{string.ascii_letters}{string.digits}", _TT_IDENT),
             # Operators:
-            ("~", _TokenType.NOT),
-            ("&", _TokenType.AND),
-            ("|", _TokenType.OR),
-            ("->", _TokenType.IMPLIES),
-            ("<->", _TokenType.IFF),
+            ("~", _TT_NOT),
+            ("&", _TT_AND),
+            ("|", _TT_OR),
+            ("->", _TT_IMPLIES),
+            ("<->", _TT_IFF),
             # Separators:
-            ("(", _TokenType.LPARENS),
-            (")", _TokenType.RPARENS),
+            ("(", _TT_LPARENS),
+            (")", _TT_RPARENS),
         ],
     )
-    def test_lex_single(self, text: str, expected_token_type: _TokenType):
-        assert list(_lex(text)) == [(expected_token_type, text)]
+    def test_lex_single(self, text: str, expected_token_type: int):
+        assert _scan(text) == [(expected_token_type, text)]
 
     @pytest.mark.parametrize("d", string.digits)
     def test_atomic_name_starting_digit_fail(self, d: str):
         mes = _unexp_char(d)
         with pytest.raises(ValueError, match=re.escape(mes)):
-            list(_lex(f"{d}abc"))
+            prop(f"{d}abc")
+
+    @pytest.mark.parametrize(
+        "text,c",
+        [
+            ("\u00b2", "\u00b2"),
+            ("P & \u00bd", "\u00bd"),
+            ("~\u2177\u2028", "\u2177"),
+        ],
+    )
+    def test_atomic_name_starting_numeric_fail(self, text: str, c: str):
+        """Tests that numeric characters which are not decimal digits (such as
+        superscripts, fractions, and roman numerals) cannot start a name."""
+        mes = _unexp_char(c)
+        assert _scan(text)[-1] == (_TT_ERROR, "")
+        with pytest.raises(ValueError, match=re.escape(mes)):
+            prop(text)
 
     @pytest.mark.parametrize(
         "s,expected_tokens",
@@ -86,30 +101,30 @@ class TestLex:
             (" \t\f\r\n", []),
             (
                 " \t\f\r\n-> \t\f\r\n",
-                [(_TokenType.IMPLIES, "->")],
+                [(_TT_IMPLIES, "->")],
             ),
             (
                 "P \t\f\r\n-> \t\f\r\n Q",
                 [
-                    (_TokenType.IDENT, "P"),
-                    (_TokenType.IMPLIES, "->"),
-                    (_TokenType.IDENT, "Q"),
+                    (_TT_IDENT, "P"),
+                    (_TT_IMPLIES, "->"),
+                    (_TT_IDENT, "Q"),
                 ],
             ),
             (
                 "P \t\f\r\n Q R     S",
                 [
-                    (_TokenType.IDENT, "P"),
-                    (_TokenType.IDENT, "Q"),
-                    (_TokenType.IDENT, "R"),
-                    (_TokenType.IDENT, "S"),
+                    (_TT_IDENT, "P"),
+                    (_TT_IDENT, "Q"),
+                    (_TT_IDENT, "R"),
+                    (_TT_IDENT, "S"),
                 ],
             ),
         ],
     )
     def test_ignore_whitespace(self, s: str, expected_tokens: list[str]):
         """Tests that all whitespace is ignored."""
-        assert list(_lex(s)) == expected_tokens
+        assert _scan(s) == expected_tokens
 
     @pytest.mark.parametrize(
         "text",
@@ -136,9 +151,11 @@ class TestLex:
         ],
     )
     def test_raises_value_error(self, text: str):
-        """Tests that lexing the text raises ValueError"""
+        """Tests that lexing the text stops at an error, for which ValueError
+        is raised"""
+        assert _scan(text)[-1] == (_TT_ERROR, "")
         with pytest.raises(ValueError):
-            list(_lex(text))
+            _lex_error(text)
 
 
 P = Predicate("P")
@@ -271,6 +288,26 @@ class TestProp:
         """Tests `prop`"""
         assert prop(text) == expected
 
+    def test_prop_deep_nesting(self):
+        """Tests that deeply nested text can be parsed without exceeding the
+        recursion limit."""
+        u: Proposition = P
+        v: Proposition = P
+        for _ in range(10_000):
+            u = Not(u)
+            v = And(Q, v)
+        assert prop("~" * 10_000 + "P") == u
+        assert prop("(" * 10_000 + "P" + ")" * 10_000) == P
+        assert prop(str(v)) == v
+        with pytest.raises(ValueError, match=re.escape(_UNEXP_END_OF_STR)):
+            prop("(" * 10_000 + "P" + ")" * 9_999)
+
+    def test_prop_cached(self):
+        """Tests that parsing the same text again gives the same object"""
+        u = prop("(P -> Q) & R")
+        assert prop("(P -> Q) & R") is u
+        assert prop("(P -> Q) & ~R") is not u
+
     @pytest.mark.parametrize(
         "text",
         [
@@ -286,6 +323,8 @@ class TestProp:
             "!P",
             "(",
             ")",
+            "",
+            " \t ",
         ],
     )
     def test_prop_fail(self, text: str):